@@ -19,7 +19,7 @@ import random
 import threading
 import time
 import uuid
-from typing import Dict, List, Tuple, Union
+from typing import Dict, Iterable, List, Tuple, Union
 from urllib.parse import urlparse
 
 from nvflare.fuel.f3.cellnet.connector_manager import ConnectorManager
@@ -116,7 +116,7 @@ class CellAgent:
 
 
 class _Waiter(threading.Event):
-    def __init__(self, targets: List[str]):
+    def __init__(self, targets: Iterable[str]):
         super().__init__()
         self.targets = [x for x in targets]
         self.reply_time = {}  # target_id => reply recv timestamp
@@ -1280,9 +1280,9 @@ class CoreCell(MessageReceiver, EndpointMonitor):
         Returns: a dict of: target name => reply message
 
         """
-        targets = [t for t in target_msgs]
-        self.logger.debug(f"{self.my_info.fqcn}: broadcasting to {targets} ...")
-        waiter = _Waiter(targets)
+        # the waiter must know all targets before any request is sent, since replies are matched against them
+        waiter = _Waiter(target_msgs.keys())
+        self.logger.debug(f"{self.my_info.fqcn}: broadcasting to {waiter.targets} ...")
         if waiter.id in self.waiters:
             raise RuntimeError("waiter not unique!")
         self.waiters[waiter.id] = waiter
@@ -13,13 +13,18 @@
 # limitations under the License.
 
 from nvflare.fuel.f3.cellnet.core_cell import FQCN
-from nvflare.fuel.f3.cellnet.core_cell import Message as CellMessage
 from nvflare.fuel.f3.cellnet.core_cell import TargetMessage
 from nvflare.private.admin_defs import Message
 from nvflare.private.defs import CellChannel, new_cell_message
 
+# new_cell_message copies the headers into a new dict, so this shared empty dict is never mutated
+_EMPTY_HEADERS = {}
+
 
 class ClientReply(object):
+
+    __slots__ = ("client_token", "client_name", "request", "reply")
+
     def __init__(self, client_token: str, client_name: str, req: Message, reply: Message):
         """Client reply.
 
@@ -65,43 +70,47 @@ def send_requests(
     if len(requests) == 0:
         return []
 
+    # the channel only depends on job_id, so decide it once for all clients
+    if job_id:
+        channel = CellChannel.CLIENT_COMMAND
+        optional = True
+        # same as FQCN.join([client.name, job_id]), without building a list for each client
+        job_suffix = FQCN.SEPARATOR + job_id
+    else:
+        channel = CellChannel.CLIENT_MAIN
+        job_suffix = ""
+
+    # local bindings to avoid repeated global/attribute lookups in the loop
+    target_msg_cls = TargetMessage
+    new_msg = new_cell_message
+    get_client = clients.get
+
+    # no reply is expected for fire-and-forget, so there is nothing to track for it
+    fire_and_forget = timeout_secs <= 0.0
+
     target_msgs = {}
-    name_to_token = {}
-    name_to_req = {}
+    name_to_info = {}  # client name => (client token, request)
     for token, req in requests.items():
-        client = clients.get(token)
+        # clients may be changed by other threads (e.g. client_dead), so look up each token safely
+        client = get_client(token)
         if not client:
             continue
 
-        if job_id:
-            fqcn = FQCN.join([client.name, job_id])
-            channel = CellChannel.CLIENT_COMMAND
-            optional = True
-        else:
-            fqcn = client.name
-            channel = CellChannel.CLIENT_MAIN
-        target_msgs[client.name] = TargetMessage(
-            target=fqcn, channel=channel, topic=command, message=new_cell_message({}, req)
+        target_msgs[client.name] = target_msg_cls(
+            target=client.name + job_suffix, channel=channel, topic=command, message=new_msg(_EMPTY_HEADERS, req)
         )
-
-        name_to_token[client.name] = token
-        name_to_req[client.name] = req
+        if not fire_and_forget:
+            name_to_info[client.name] = (token, req)
 
     if not target_msgs:
         return []
 
-    if timeout_secs <= 0.0:
-        # this is fire-and-forget!
+    if fire_and_forget:
         cell.fire_multi_requests_and_forget(target_msgs, optional=optional)
         return []
     else:
-        result = []
         replies = cell.broadcast_multi_requests(target_msgs, timeout_secs, optional=optional)
-        for name, reply in replies.items():
-            assert isinstance(reply, CellMessage)
-            result.append(
-                ClientReply(
-                    client_token=name_to_token[name], client_name=name, req=name_to_req[name], reply=reply.payload
-                )
-            )
-        return result
+        reply_cls = ClientReply
+        return [
+            reply_cls((info := name_to_info[name])[0], name, info[1], reply.payload) for name, reply in replies.items()
+        ]
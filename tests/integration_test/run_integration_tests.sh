@@ -28,6 +28,7 @@ while getopts ":m:dc" option; do
             ;;
         d) # debug
             export FL_LOG_LEVEL=DEBUG
+            export NVFLARE_TEST_VERBOSE=1
             cmd="pytest --junitxml=./integration_test.xml -vv --log-cli-level=DEBUG --capture=no"
             ;;
         c) # Clean up
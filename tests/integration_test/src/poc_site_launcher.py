@@ -35,8 +35,7 @@ class POCSiteLauncher(SiteLauncher):
         super().__init__()
 
         self.poc_temp_dir = tempfile.mkdtemp()
-        if os.path.exists(self.poc_temp_dir):
-            shutil.rmtree(self.poc_temp_dir)
+        shutil.rmtree(self.poc_temp_dir)
         _prepare_poc(clients=[], number_of_clients=n_clients, workspace=self.poc_temp_dir)
         self.poc_dir = os.path.join(self.poc_temp_dir, "example_project", "prod_00")
         print(f"Using POC at dir: {self.poc_dir}")
@@ -34,6 +34,12 @@ from nvflare.fuel.utils.class_utils import instantiate_class
 from .constants import DEFAULT_RESOURCE_CONFIG, FILE_STORAGE, PROVISION_SCRIPT, RESOURCE_CONFIG
 from .example import Example
 
+try:
+    # libyaml-backed loader is much faster than the pure Python one
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 OUTPUT_YAML_DIR = os.path.join("data", "test_configs", "generated")
 PROJECT_YAML = os.path.join("data", "projects", "ha_1_servers_2_clients.yml")
 POSTFIX = "_copy"
@@ -45,15 +51,18 @@ def read_yaml(yaml_file_path):
         raise RuntimeError(f"Yaml file doesnt' exist at {yaml_file_path}")
 
     with open(yaml_file_path, "rb") as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=_YamlLoader)
 
     return data
 
 
 def cleanup_path(path: str):
-    if os.path.exists(path):
-        print(f"Clean up directory: {path}")
+    # no separate exists check: it costs an extra stat and the path may vanish in between anyway
+    try:
         shutil.rmtree(path)
+    except FileNotFoundError:
+        return
+    print(f"Cleaned up directory: {path}")
 
 
 def run_provision_command(project_yaml: str, workspace: str):
@@ -32,9 +32,7 @@ from tests.integration_test.src import (
 
 
 def get_module_class_from_full_path(full_path):
-    tokens = full_path.split(".")
-    cls_name = tokens[-1]
-    mod_name = ".".join(tokens[: len(tokens) - 1])
+    mod_name, _, cls_name = full_path.rpartition(".")
     return mod_name, cls_name
 
 
@@ -70,6 +68,8 @@ def get_test_config(test_config_yaml: str):
 
 
 framework = os.environ.get("NVFLARE_TEST_FRAMEWORK")
+# server/client status queries are admin round trips only used for logging, so they are opt-in
+verbose = os.environ.get("NVFLARE_TEST_VERBOSE") == "1"
 test_configs_yaml = "auto_test_configs.yml" if framework == "auto" else "test_configs.yml"
 test_configs = read_yaml(test_configs_yaml)
 if framework not in test_configs["test_configs"]:
@@ -174,15 +174,17 @@ class TestSystem:
     def test_run_job_complete(self, setup_and_teardown_system):
         ha, test_cases, site_launcher, test_driver = setup_and_teardown_system
 
-        print(f"Server status: {test_driver.server_status()}.")
-        print(f"Client status: {test_driver.client_status()}")
+        if verbose:
+            print(f"Server status: {test_driver.server_status()}.")
+            print(f"Client status: {test_driver.client_status()}")
 
         test_validate_results = []
+        validator_classes = {}  # validator path => validator class, reused across test cases
         for test_data in test_cases:
             test_name, validators, setup, teardown, event_sequence, reset_job_info = test_data
             print(f"Running test {test_name}")
 
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             for command in setup:
                 print(f"Running setup command: {command}")
                 process = run_command_in_subprocess(command)
@@ -201,8 +203,11 @@ class TestSystem:
                     validator_module = validator["path"]
                     validator_args = validator.get("args", {})
                     # Create validator instance
-                    module_name, class_name = get_module_class_from_full_path(validator_module)
-                    job_validator_cls = getattr(importlib.import_module(module_name), class_name)
+                    job_validator_cls = validator_classes.get(validator_module)
+                    if job_validator_cls is None:
+                        module_name, class_name = get_module_class_from_full_path(validator_module)
+                        job_validator_cls = getattr(importlib.import_module(module_name), class_name)
+                        validator_classes[validator_module] = job_validator_cls
                     job_validator = job_validator_cls(**validator_args)
 
                     job_validate_res = job_validator.validate_results(
@@ -218,7 +223,8 @@ class TestSystem:
                 validate_result = "No Validators"
             test_validate_results.append((test_name, validate_result))
 
-            print(f"Finished running test '{test_name}' in {time.time() - start_time} seconds.")
+            elapsed_s = (time.perf_counter_ns() - start_ns) / 1e9
+            print(f"Finished running test '{test_name}' in {elapsed_s} seconds.")
             for command in teardown:
                 print(f"Running teardown command: {command}")
                 process = run_command_in_subprocess(command)
@@ -0,0 +1,110 @@
+# Copyright (c) 2023, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+from nvflare.fuel.f3.cellnet.core_cell import Message as CellMessage
+from nvflare.private.admin_defs import Message
+from nvflare.private.defs import CellChannel
+from nvflare.private.fed.server.admin import _Client
+from nvflare.private.fed.server.message_send import _EMPTY_HEADERS, send_requests
+
+
+class _MockCell:
+    def __init__(self):
+        self.sent = None
+        self.optional = None
+        self.fired = False
+        self.broadcast = False
+
+    def broadcast_multi_requests(self, target_msgs, timeout=None, secure=False, optional=False):
+        self.sent = dict(target_msgs)
+        self.broadcast = True
+        self.optional = optional
+        return {name: CellMessage(payload=f"reply_{name}") for name in self.sent}
+
+    def fire_multi_requests_and_forget(self, target_msgs, optional=False):
+        self.sent = dict(target_msgs)
+        self.optional = optional
+        self.fired = True
+        return {}
+
+
+def _make_clients(names):
+    return {f"token_{n}": _Client(token=f"token_{n}", name=n) for n in names}
+
+
+class TestSendRequests:
+    def test_invalid_requests(self):
+        with pytest.raises(TypeError):
+            send_requests(_MockCell(), "cmd", requests=["not a dict"], clients={})
+
+    def test_no_valid_clients(self):
+        cell = _MockCell()
+        clients = _make_clients(["site-1"])
+        replies = send_requests(cell, "cmd", {"unknown": Message("t", "b")}, clients)
+        assert replies == []
+        assert cell.sent is None
+
+    @pytest.mark.parametrize(
+        "job_id, channel, target, optional",
+        [
+            (None, CellChannel.CLIENT_MAIN, "site-1", False),
+            ("job1", CellChannel.CLIENT_COMMAND, "site-1.job1", True),
+        ],
+    )
+    def test_send_and_reply(self, job_id, channel, target, optional):
+        cell = _MockCell()
+        clients = _make_clients(["site-1", "site-2"])
+        req = Message("t", "b")
+        requests = {"token_site-1": req, "unknown": Message("t", "b")}
+        replies = send_requests(cell, "cmd", requests, clients, job_id=job_id)
+
+        assert list(cell.sent.keys()) == ["site-1"]
+        tm = cell.sent["site-1"]
+        assert tm.target == target
+        assert tm.channel == channel
+        assert tm.topic == "cmd"
+        assert tm.message.payload is req
+        assert tm.message.headers is not _EMPTY_HEADERS
+        assert not _EMPTY_HEADERS
+        assert cell.optional == optional
+
+        assert len(replies) == 1
+        reply = replies[0]
+        assert reply.client_token == "token_site-1"
+        assert reply.client_name == "site-1"
+        assert reply.request is req
+        assert reply.reply == "reply_site-1"
+
+    def test_fire_and_forget(self):
+        cell = _MockCell()
+        clients = _make_clients(["site-1", "site-2"])
+        requests = {token: Message("t", "b") for token in clients}
+        requests["unknown"] = Message("t", "b")
+        replies = send_requests(cell, "cmd", requests, clients, timeout_secs=0.0)
+        assert replies == []
+        assert cell.fired
+        assert not cell.broadcast
+        assert {name: tm.message.payload for name, tm in cell.sent.items()} == {
+            "site-1": requests["token_site-1"],
+            "site-2": requests["token_site-2"],
+        }
+
+    def test_fire_and_forget_no_valid_clients(self):
+        cell = _MockCell()
+        clients = _make_clients(["site-1"])
+        replies = send_requests(cell, "cmd", {"unknown": Message("t", "b")}, clients, timeout_secs=0.0)
+        assert replies == []
+        assert not cell.fired